@@ -45,7 +45,7 @@ __all__ = [
 ]
 
 
-LOG = logging.getLogger(__file__)
+LOG = logging.getLogger(__name__)
 
 
 class API(jsonapi.base.api.API):
@@ -35,7 +35,7 @@ import asyncio
 # local
 import jsonapi
 from jsonapi.base import errors
-from jsonapi.base.utilities import relative_identifiers
+from jsonapi.base.utilities import relationship_identifiers
 
 
 __all__ = [
@@ -70,33 +70,63 @@ class Session(jsonapi.base.database.Session):
         **May be overridden** for performance reasons.
 
         Does the same as :meth:`jsonapi.base.database.Session.get_relatives`,
-        but asynchronous.
-
-        .. todo::
-
-            Fetch the different paths in *paths* parallel.
+        but asynchronous. The relatives on the same depth of the include
+        paths (e.g. *author* and *comments* in ``author,comments.author``)
+        are fetched concurrently.
         """
         all_relatives = dict()
-        root_resources = resources
+        if not (resources and paths):
+            return all_relatives
 
+        # Merge the paths into a prefix tree. This way, a common prefix like
+        # *comments* in ``comments.author`` and ``comments.editor`` is only
+        # fetched once.
+        tree = dict()
         for path in paths:
-            resources = root_resources
+            node = tree
             for relname in path:
-                # Collect the ids of all related resources.
-                relids = set()
-                for resource in resources:
-                    try:
-                        tmp = relative_identifiers(relname, resource)
-                    except errors.RelationshipNotFound:
-                        raise errors.UnresolvableIncludePath(path)
-                    else:
+                node = node.setdefault(relname, dict())
+
+        # Walk through the tree level by level. Each node is resolved only
+        # once for all relatives of its parent node.
+        todo = [(resources, tree, list())]
+        while todo:
+            # Collect the ids of the related resources for all nodes on the
+            # current level.
+            nodes = list()
+            for resources, tree, parent_path in todo:
+                for relname, subtree in tree.items():
+                    path = parent_path + [relname]
+
+                    relids = set()
+                    relationships = dict()
+                    for resource in resources:
+                        # The resources usually share only a few types, so
+                        # we look up the relationship only once per schema.
+                        schema = resource._jsonapi["schema"]
+                        relationship = relationships.get(schema)
+                        if relationship is None:
+                            relationship = schema.relationships.get(relname)
+                            if relationship is None:
+                                raise errors.UnresolvableIncludePath(path)
+                            relationships[schema] = relationship
+                        tmp = relationship_identifiers(relationship, resource)
                         relids.update(tmp)
 
-                # Query the relatives from the database.
-                relatives = yield from self.get_many(relids, required=True)
-                all_relatives.update(relatives)
+                    if relids:
+                        nodes.append((relids, subtree, path))
 
-                # The next relationship name in the path is defined on the
-                # previously fetched relatives.
-                resources = relatives.values()
+            # Query the relatives of all nodes concurrently.
+            results = yield from asyncio.gather(*[
+                self.get_many(relids, required=True)
+                for relids, subtree, path in nodes
+            ])
+
+            # The next relationship names in the paths are defined on the
+            # previously fetched relatives.
+            todo = list()
+            for (relids, subtree, path), relatives in zip(nodes, results):
+                all_relatives.update(relatives)
+                if subtree:
+                    todo.append((relatives.values(), subtree, path))
         return all_relatives
@@ -42,6 +42,10 @@ class RelatedHandler(BaseHandler):
     Returns the related resources for the resource.
     """
 
+    __slots__ = (
+        "typename", "relname", "real_typename", "resource_id", "resource"
+    )
+
     def __init__(self, api, db, request):
         """
         """
@@ -98,7 +102,7 @@ class RelatedHandler(BaseHandler):
 
         # Create the response
         self.response.headers["content-type"] = "application/vnd.api+json"
-        self.response.status_code = 200
+        self.response.status = 200
         self.response.body = self.api.dump_json(OrderedDict([
             ("data", data),
             ("included", included),
@@ -43,6 +43,11 @@ class RelationshipHandler(BaseHandler):
     Handles the relationship endpoint.
     """
 
+    __slots__ = (
+        "typename", "relname", "real_typename", "resource_id", "resource",
+        "relationship"
+    )
+
     def __init__(self, api, db, request):
         """
         """
@@ -114,7 +119,7 @@ class RelationshipHandler(BaseHandler):
         http://jsonapi.org/format/#fetching-relationships
         """
         self.response.headers["content-type"] = "application/vnd.api+json"
-        self.response.status_code = 200
+        self.response.status = 200
         self.response.body = self.build_body()
         return None
 
@@ -147,7 +152,7 @@ class RelationshipHandler(BaseHandler):
 
         # Build the response
         self.response.headers["content-type"] = "application/vnd.api+json"
-        self.response.status_code = 200
+        self.response.status = 200
         self.response.body = self.build_body()
         return None
 
@@ -174,7 +179,7 @@ class RelationshipHandler(BaseHandler):
 
         # Build the response
         self.response.headers["content-type"] = "application/vnd.api+json"
-        self.response.status_code = 200
+        self.response.status = 200
         self.response.body = self.build_body()
         return None
 
@@ -192,6 +197,6 @@ class RelationshipHandler(BaseHandler):
 
         # Build the response
         self.response.headers["content-type"] = "application/vnd.api+json"
-        self.response.status_code = 200
+        self.response.status = 200
         self.response.body = self.build_body()
         return None
@@ -43,6 +43,8 @@ class ResourceHandler(BaseHandler):
     Handles a resource endpoint.
     """
 
+    __slots__ = ("typename", "real_typename", "resource_id", "resource")
+
     def __init__(self, api, db, request):
         """
         """
@@ -83,27 +85,29 @@ class ResourceHandler(BaseHandler):
 
         http://jsonapi.org/format/#fetching-resources
         """
-        # Fetch the included resources.
-        included_resources = yield from self.db.get_relatives(
-            [self.resource], self.request.japi_include
-        )
-
         # Build the response document.
         serializer = self.api.get_serializer(self.real_typename)
         data = serializer.serialize_resource(
             self.resource, fields=self.request.japi_fields.get(self.typename)
         )
 
-        included = serialize_many(
-            included_resources.values(), self.request.japi_fields
-        )
+        # Fetch the included resources, if any.
+        if self.request.japi_include:
+            included_resources = yield from self.db.get_relatives(
+                [self.resource], self.request.japi_include
+            )
+            included = serialize_many(
+                included_resources.values(), self.request.japi_fields
+            )
+        else:
+            included = list()
 
         meta = OrderedDict()
         links = OrderedDict()
 
         # Put all together
         self.response.headers["content-type"] = "application/vnd.api+json"
-        self.response.status_code = 200
+        self.response.status = 200
         self.response.body = self.api.dump_json(OrderedDict([
             ("data", data),
             ("included", included),
@@ -143,7 +147,7 @@ class ResourceHandler(BaseHandler):
 
         # Put all together.
         self.response.headers["content-type"] = "application/vnd.api+json"
-        self.response.status_code = 200
+        self.response.status = 200
         self.response.body = self.api.dump_json(OrderedDict([
             ("data", data),
             ("included", included),
@@ -162,5 +166,5 @@ class ResourceHandler(BaseHandler):
         yield from self.db.commit()
 
         # Create the response.
-        self.response.status_code = 204
+        self.response.status = 204
         return None
@@ -32,6 +32,7 @@ Contains an *unserializer* that works with asynchronous database drivers.
 # std
 import asyncio
 import logging
+from operator import itemgetter
 
 # local
 import jsonapi
@@ -43,7 +44,10 @@ __all__ = [
 ]
 
 
-LOG = logging.getLogger(__file__)
+LOG = logging.getLogger(__name__)
+
+# Returns the ``(type, id)`` tuple of a resource identifier object.
+_TYPE_ID = itemgetter("type", "id")
 
 
 class Unserializer(jsonapi.base.serializer.Unserializer):
@@ -57,47 +61,47 @@ class Unserializer(jsonapi.base.serializer.Unserializer):
         """
         The same as the base class method, but calls the *db* async.
         """
-        # Collect the identifiers.
+        # Collect the identifiers. We remember them for each relationship,
+        # so that the relationships object is parsed only once.
         identifiers = set()
+        to_one = dict()
+        to_many = dict()
+        result = dict()
         for relname, relobj in relationships_object.items():
-            reldata = relobj.get("data")
+            if "data" not in relobj:
+                continue
+            reldata = relobj["data"]
+
+            # *to-one* relationship with no target
+            if reldata is None:
+                result[relname] = None
 
             # *to-one* relationship (with target)
             # -> a single resource identifier object
-            if isinstance(reldata, dict):
-                identifiers.add((reldata["type"], reldata["id"]))
+            elif isinstance(reldata, dict):
+                identifier = _TYPE_ID(reldata)
+                identifiers.add(identifier)
+                to_one[relname] = identifier
 
             # *to-many* relationship
             # -> a list of resource identifier objects
             elif isinstance(reldata, list):
-                identifiers.update(
-                    (item["type"], item["id"]) for item in reldata
-                )
+                relids = list(map(_TYPE_ID, reldata))
+                identifiers.update(relids)
+                to_many[relname] = relids
 
-        # Load the resources
-        relatives = yield from db.get_many(identifiers, required=True)
+        # Load the resources. If the relationships are all empty, we can
+        # spare us the database query.
+        if identifiers:
+            relatives = yield from db.get_many(identifiers, required=True)
+        else:
+            relatives = dict()
 
         # Map the relationship names back to the related resources.
-        result = dict()
-        for relname, relobj in relationships_object.items():
-            if "data" in relobj:
-                reldata = relobj["data"]
-
-                # *to-one* relationship with no target
-                if reldata is None:
-                    result[relname] = None
-                # *to-one* relationship with target
-                elif isinstance(reldata, dict):
-                    identifier = (reldata["type"], reldata["id"])
-                    result[relname] = relatives[identifier]
-                # *to-many* relationship
-                elif isinstance(reldata, list):
-                    identifiers = [
-                        (item["type"], item["id"]) for item in reldata
-                    ]
-                    result[relname] = [
-                        relatives[identifier] for identifier in identifiers
-                    ]
+        for relname, identifier in to_one.items():
+            result[relname] = relatives[identifier]
+        for relname, relids in to_many.items():
+            result[relname] = list(map(relatives.__getitem__, relids))
         return result
 
     @asyncio.coroutine
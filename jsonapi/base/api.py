@@ -44,6 +44,11 @@ try:
 except ImportError:
     bson = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # local
 from .. import version
 from . import errors
@@ -57,10 +62,12 @@ __all__ = [
 ]
 
 
-LOG = logging.getLogger(__file__)
+LOG = logging.getLogger(__name__)
 
 
-ARG_DEFAULT = []
+#: Sentinel for *default* arguments, which have not been given. It is only
+#: compared by identity, so a plain, hashable :class:`object` is sufficient.
+ARG_DEFAULT = object()
 
 
 def build_uris(base_uri):
@@ -260,9 +267,10 @@ class API(object):
             If the resource type of *o* is not known to the API and no default
             argument is given.
         """
-        typename = self._typenames.get(o) \
-            or self._typenames.get(type(o)) \
-            or default
+        # The typenames are mapped by the resource class, so we need only a
+        # single lookup. This also avoids hashing the resource itself.
+        resource_class = o if isinstance(o, type) else type(o)
+        typename = self._typenames.get(resource_class, default)
 
         if typename is ARG_DEFAULT:
             raise KeyError("The type of *o* is not known to the API.")
@@ -288,34 +296,51 @@ class API(object):
 
     def dump_json(self, d):
         """
-        Encodes the object *d* as JSON string.
+        Encodes the object *d* as JSON document.
 
         This method *can be overridden* if you want to use your own json
         serializer.
 
-        The default implementation uses the :mod:`json` module of the standard
-        library and (if available) the :mod:`bson` json utils.
+        The default implementation uses :mod:`orjson` if it is installed and
+        the :mod:`json` module of the standard library otherwise. If the
+        :mod:`bson` json utils are available or the API is in debug mode, we
+        always use the :mod:`json` module, so that BSON types (e.g.
+        ``{"$date": ...}``) are encoded like :meth:`load_json` expects them
+        and the debug output looks the same in every environment.
 
         :arg d:
-        :rtype: str
-        """
+        :rtype: bytes
+        """
+        # orjson encodes datetimes and UUIDs itself and never calls the
+        # bson hook for them.
+        if orjson and not bson and not self.debug:
+            try:
+                return orjson.dumps(d, option=orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                # orjson is stricter than the json module (e.g. integers
+                # wider than 64 bit), so we fall back to the latter.
+                pass
+
+        default = bson.json_util.default if bson else None
         indent = 1 if self.debug else None
-        if bson:
-            return json.dumps(d, default=bson.json_util.default, indent=indent)
-        else:
-            return json.dumps(d, indent=indent)
+        return json.dumps(d, default=default, indent=indent).encode()
 
     def load_json(self, s):
         """
-        Decods the JSON string *s*.
+        Decods the JSON document *s*.
 
         This method *can be overridden* if you want to use your own json
-        serializer.
+        serializer. Please note, that *s* may be a :class:`str` or the
+        (UTF-8, UTF-16 or UTF-32 encoded) :class:`bytes` of the request body.
+        If a :exc:`TypeError` is raised for :class:`bytes` (like the
+        :mod:`json` module does before Python 3.6), the request calls this
+        method again with the decoded :class:`str`.
 
         The default implementation uses the :mod:`json` module of the standard
         library and (if available) the :mod:`bson` json utils.
 
-        :arg str s:
+        :arg s:
+            A :class:`str` or :class:`bytes` object
         """
         if bson:
             return json.loads(s, object_hook=bson.json_util.object_hook)
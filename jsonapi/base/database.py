@@ -36,7 +36,7 @@ can take a look at the existing database adapters, if you need an example.
 
 # local
 from . import errors
-from .utilities import relative_identifiers
+from .utilities import relationship_identifiers
 
 
 __all__ = [
@@ -280,26 +280,51 @@ class Session(object):
             of this method.
         """
         all_relatives = dict()
-        root_resources = resources
+        if not (resources and paths):
+            return all_relatives
 
+        # Merge the paths into a prefix tree. This way, a common prefix like
+        # *comments* in ``comments.author`` and ``comments.editor`` is only
+        # fetched once.
+        tree = dict()
         for path in paths:
-            resources = root_resources
+            node = tree
             for relname in path:
+                node = node.setdefault(relname, dict())
+
+        # Walk through the tree. Each node is resolved only once for all
+        # relatives of its parent node.
+        todo = [(resources, tree, list())]
+        while todo:
+            resources, tree, parent_path = todo.pop()
+            for relname, subtree in tree.items():
+                path = parent_path + [relname]
+
                 # Collect the ids of all related resources.
                 relids = set()
+                relationships = dict()
                 for resource in resources:
-                    try:
-                        tmp = relative_identifiers(relname, resource)
-                    except errors.RelationshipNotFound:
-                        raise errors.UnresolvableIncludePath(path)
-                    else:
-                        relids.update(tmp)
+                    # The resources usually share only a few types, so we look
+                    # up the relationship only once per schema.
+                    schema = resource._jsonapi["schema"]
+                    relationship = relationships.get(schema)
+                    if relationship is None:
+                        relationship = schema.relationships.get(relname)
+                        if relationship is None:
+                            raise errors.UnresolvableIncludePath(path)
+                        relationships[schema] = relationship
+                    tmp = relationship_identifiers(relationship, resource)
+                    relids.update(tmp)
+
+                if not relids:
+                    continue
 
                 # Query the relatives from the database.
                 relatives = self.get_many(relids, required=True)
                 all_relatives.update(relatives)
 
-                # The next relationship name in the path is defined on the
+                # The next relationship names in the path are defined on the
                 # previously fetched relatives.
-                resources = relatives.values()
+                if subtree:
+                    todo.append((relatives.values(), subtree, path))
         return all_relatives
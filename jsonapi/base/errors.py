@@ -36,6 +36,9 @@ from collections import OrderedDict
 # third party
 from cached_property import cached_property
 
+# local
+from .response import Response
+
 
 __all__ = [
     "Error",
@@ -217,8 +220,6 @@ def error_to_response(error, json_dumps):
     """
     assert isinstance(error, (Error, ErrorList))
 
-    from .response import Response
-
     headers = {
         "content-type": "application/vnd.api+json"
     }
@@ -41,6 +41,8 @@ class BaseHandler(object):
     :arg jsonapi.base.request.Request request:
     """
 
+    __slots__ = ("api", "request", "response", "db")
+
     def __init__(self, api, db, request):
         """
         """
@@ -43,6 +43,8 @@ class CollectionHandler(BaseHandler):
     Handles the collection endpoint.
     """
 
+    __slots__ = ("typename",)
+
     def __init__(self, api, db, request):
         """
         """
@@ -79,18 +81,21 @@ class CollectionHandler(BaseHandler):
             offset=offset, filters=self.request.japi_filters
         )
 
-        # Fetch all related resources, which should be included.
-        included_resources = self.db.get_relatives(
-            resources, self.request.japi_include
-        )
-
         # Build the response.
         data = serialize_many(resources, fields=self.request.japi_fields)
-        included = serialize_many(
-            included_resources.values(), fields=self.request.japi_fields
-        )
-        meta = OrderedDict()
-        links = OrderedDict()
+
+        # Fetch and serialize all related resources, which should be
+        # included. Most requests have no *include* parameter, so we skip
+        # this step completely in that case.
+        if self.request.japi_include:
+            included_resources = self.db.get_relatives(
+                resources, self.request.japi_include
+            )
+            included = serialize_many(
+                included_resources.values(), fields=self.request.japi_fields
+            )
+        else:
+            included = list()
 
         # Add the pagination links, if necessairy.
         if self.request.japi_paginate:
@@ -99,12 +104,15 @@ class CollectionHandler(BaseHandler):
             )
 
             pagination = Pagination(self.request, total_resources)
-            meta.update(pagination.json_meta)
-            links.update(pagination.json_links)
+            meta = pagination.json_meta
+            links = pagination.json_links
+        else:
+            meta = OrderedDict()
+            links = OrderedDict()
 
         # Put all together
         self.response.headers["content-type"] = "application/vnd.api+json"
-        self.response.status_code = 200
+        self.response.status = 200
         self.response.body = self.api.dump_json(OrderedDict([
             ("data", data),
             ("included", included),
@@ -153,7 +161,7 @@ class CollectionHandler(BaseHandler):
         # Put everything together.
         self.response.headers["content-type"] = "application/vnd.api+json"
         self.response.headers["location"] = links["self"]
-        self.response.status_code = 201
+        self.response.status = 201
         self.response.body = self.api.dump_json(OrderedDict([
             ("data", data),
             ("links", links),
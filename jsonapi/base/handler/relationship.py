@@ -42,6 +42,11 @@ class RelationshipHandler(BaseHandler):
     Handles the relationship endpoint.
     """
 
+    __slots__ = (
+        "typename", "relname", "real_typename", "resource_id", "resource",
+        "relationship"
+    )
+
     def __init__(self, api, db, request):
         """
         """
@@ -111,7 +116,7 @@ class RelationshipHandler(BaseHandler):
         http://jsonapi.org/format/#fetching-relationships
         """
         self.response.headers["content-type"] = "application/vnd.api+json"
-        self.response.status_code = 200
+        self.response.status = 200
         self.response.body = self.build_body()
         return None
 
@@ -143,7 +148,7 @@ class RelationshipHandler(BaseHandler):
 
         # Build the response
         self.response.headers["content-type"] = "application/vnd.api+json"
-        self.response.status_code = 200
+        self.response.status = 200
         self.response.body = self.build_body()
         return None
 
@@ -169,7 +174,7 @@ class RelationshipHandler(BaseHandler):
 
         # Build the response
         self.response.headers["content-type"] = "application/vnd.api+json"
-        self.response.status_code = 200
+        self.response.status = 200
         self.response.body = self.build_body()
         return None
 
@@ -186,6 +191,6 @@ class RelationshipHandler(BaseHandler):
 
         # Build the response
         self.response.headers["content-type"] = "application/vnd.api+json"
-        self.response.status_code = 200
+        self.response.status = 200
         self.response.body = self.build_body()
         return None
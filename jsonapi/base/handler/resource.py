@@ -42,6 +42,8 @@ class ResourceHandler(BaseHandler):
     Handles a resource endpoint.
     """
 
+    __slots__ = ("typename", "real_typename", "resource_id", "resource")
+
     def __init__(self, api, db, request):
         """
         """
@@ -80,27 +82,29 @@ class ResourceHandler(BaseHandler):
 
         http://jsonapi.org/format/#fetching-resources
         """
-        # Fetch the included resources.
-        included_resources = self.db.get_relatives(
-            [self.resource], self.request.japi_include
-        )
-
         # Build the response document.
         serializer = self.api.get_serializer(self.real_typename)
         data = serializer.serialize_resource(
             self.resource, fields=self.request.japi_fields.get(self.typename)
         )
 
-        included = serialize_many(
-            included_resources.values(), self.request.japi_fields
-        )
+        # Fetch the included resources, if any.
+        if self.request.japi_include:
+            included_resources = self.db.get_relatives(
+                [self.resource], self.request.japi_include
+            )
+            included = serialize_many(
+                included_resources.values(), self.request.japi_fields
+            )
+        else:
+            included = list()
 
         meta = OrderedDict()
         links = OrderedDict()
 
         # Put all together
         self.response.headers["content-type"] = "application/vnd.api+json"
-        self.response.status_code = 200
+        self.response.status = 200
         self.response.body = self.api.dump_json(OrderedDict([
             ("data", data),
             ("included", included),
@@ -139,7 +143,7 @@ class ResourceHandler(BaseHandler):
 
         # Put all together.
         self.response.headers["content-type"] = "application/vnd.api+json"
-        self.response.status_code = 200
+        self.response.status = 200
         self.response.body = self.api.dump_json(OrderedDict([
             ("data", data),
             ("included", included),
@@ -157,5 +161,5 @@ class ResourceHandler(BaseHandler):
         self.db.commit()
 
         # Create the response.
-        self.response.status_code = 204
+        self.response.status = 204
         return None
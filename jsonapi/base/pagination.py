@@ -32,11 +32,7 @@ http://jsonapi.org/format/#fetching-pagination
 
 # std
 from collections import OrderedDict
-import math
-import urllib
-
-# third party
-from cached_property import cached_property
+import urllib.parse
 
 
 class Pagination(object):
@@ -59,6 +55,12 @@ class Pagination(object):
         *   http://jsonapi.org/format/#fetching-pagination
     """
 
+    __slots__ = (
+        "request", "current_page", "page_size", "total_resources",
+        "total_pages", "_link_prefix", "link_self", "link_first", "link_last",
+        "has_prev", "link_prev", "has_next", "link_next"
+    )
+
     def __init__(self, request, total_resources):
         """
         """
@@ -72,12 +74,32 @@ class Pagination(object):
 
         # Get the number of resources
         self.total_resources = total_resources
-        self.total_pages = math.ceil(self.total_resources/self.page_size)
+        # Integer ceil division. The first page has the number 1.
+        self.total_pages = -(-self.total_resources//self.page_size)
+
+        # All links share the same uri and query parameters (filters,
+        # sorting, ...). Only the page number and size change. So we build
+        # this common prefix once.
+        parsed_uri = self.request.parsed_uri
+        query = {
+            key: value for key, value in self.request.query.items()
+            if key not in ("page[number]", "page[size]")
+        }
+        query = urllib.parse.urlencode(query)
+        self._link_prefix = "{scheme}://{netloc}{path}?{query}".format(
+            scheme=parsed_uri.scheme,
+            netloc=parsed_uri.netloc,
+            path=parsed_uri.path,
+            query=query + "&" if query else ""
+        )
 
         # Build all links
         self.link_self = self._page_link(self.current_page, self.page_size)
         self.link_first = self._page_link(1, self.page_size)
-        self.link_last = self._page_link(self.total_pages, self.page_size)
+        # An empty collection still has one (empty) page.
+        self.link_last = self._page_link(
+            max(self.total_pages, 1), self.page_size
+        )
 
         self.has_prev = (self.current_page > 1)
         self.link_prev = self._page_link(self.current_page - 1, self.page_size)
@@ -87,20 +109,16 @@ class Pagination(object):
         return None
 
     def _page_link(self, page_number, page_size):
-        parsed_uri = self.request.parsed_uri
-        query = urllib.parse.urlencode({
-            "page[number]": page_number,
-            "page[size]": page_size
-        })
-        uri = "{scheme}://{netloc}{path}?{query}".format(
-            scheme=parsed_uri.scheme,
-            netloc=parsed_uri.netloc,
-            path=parsed_uri.path,
-            query=query
+        """
+        Returns the link to the page with the number *page_number*.
+        """
+        # The brackets in "page[number]" and "page[size]" are already
+        # percent encoded.
+        return "{}page%5Bnumber%5D={}&page%5Bsize%5D={}".format(
+            self._link_prefix, page_number, page_size
         )
-        return uri
 
-    @cached_property
+    @property
     def json_meta(self):
         """
         Must be included in the top-level meta object.
@@ -112,7 +130,7 @@ class Pagination(object):
         d["page-size"] = self.page_size
         return d
 
-    @cached_property
+    @property
     def json_links(self):
         """
         Must be included in the top-level links object.
@@ -28,6 +28,7 @@ jsonapi.base.request
 """
 
 # std
+import collections.abc
 import logging
 import re
 import urllib.parse
@@ -39,7 +40,7 @@ from cached_property import cached_property
 from . import errors
 
 
-LOG = logging.getLogger(__file__)
+LOG = logging.getLogger(__name__)
 
 
 __all__ = [
@@ -47,6 +48,68 @@ __all__ = [
 ]
 
 
+# Matches a filter query key (``filter[name]``) and captures the field name.
+_FILTER_KEY_RE = re.compile(r"filter\[([A-Za-z0-9_]+)\]")
+
+# The first group captures the filters, the second captures the value.
+_FILTER_VALUE_RE = re.compile(
+    r"(eq:|ne:|lt:|lte:|gt:|gte:|in:|nin:|all:|exists:|iexact:"\
+    r"|contains:|icontains:|startswith:|istartswith:|endswith:"\
+    r"|iendswith:)(.*)"
+)
+
+# Matches a sparse fieldset query key (``fields[typename]``) and captures
+# the typename.
+_FIELDS_RE = re.compile(r"fields\[([A-Za-z0-9_]+)\]")
+
+
+class _Headers(collections.abc.Mapping):
+    """
+    A read-only, case insensitive view on the request headers.
+
+    Most requests only look at one or two headers, so we do not lower-case
+    all keys in advance. A lookup tries the key as it is and in its canonical
+    form (``Content-Type``) first. The lower-cased index is only built, if
+    both lookups fail.
+
+    :arg headers:
+        A mapping with the original headers
+    """
+
+    __slots__ = ("_headers", "_lower")
+
+    def __init__(self, headers):
+        self._headers = headers
+        self._lower = None
+        return None
+
+    def _lower_index(self):
+        if self._lower is None:
+            self._lower = {
+                key.lower(): value for key, value in self._headers.items()
+            }
+        return self._lower
+
+    def __getitem__(self, key):
+        headers = self._headers
+        if key in headers:
+            return headers[key]
+
+        canonical_key = key.title()
+        if canonical_key in headers:
+            return headers[canonical_key]
+        return self._lower_index()[key.lower()]
+
+    def __iter__(self):
+        return iter(self._lower_index())
+
+    def __len__(self):
+        return len(self._lower_index())
+
+    def __repr__(self):
+        return repr(self._lower_index())
+
+
 class Request(object):
     """
     Wraps a request object, which can be used to call the View class.
@@ -64,7 +127,7 @@ class Request(object):
         self.api = api
         self.uri = uri
         self.method = method.lower()
-        self.headers = {key.lower(): value for key, value in headers.items()}
+        self.headers = _Headers(headers)
         self.body = body
 
         #: Contains parameters, which are encoded into the URI.
@@ -85,9 +148,20 @@ class Request(object):
     @cached_property
     def query(self):
         """
-        Returns a dictionary which maps a query key to its values.
+        Returns a dictionary which maps a query key to its (first) value.
         """
-        query = urllib.parse.parse_qs(self.parsed_uri.query)
+        # We only need the query string here. Splitting the uri is much
+        # cheaper than parsing it completely with *urlparse()*.
+        query_string = self.uri.partition("?")[2].partition("#")[0]
+
+        query = dict()
+        for key, value in urllib.parse.parse_qsl(
+            query_string, keep_blank_values=True
+            ):
+            # Blank values are ignored like missing ones, except for the
+            # sparse fieldsets: ``fields[User]=`` requests no fields at all.
+            if value or key.startswith("fields["):
+                query.setdefault(key, value)
         return query
 
     def get_query_argument(self, name, fallback=None):
@@ -98,8 +172,7 @@ class Request(object):
         :arg str name:
         :arg fallback:
         """
-        value = self.query.get(name)
-        return value[0] if value else fallback
+        return self.query.get(name, fallback)
 
     @cached_property
     def content_type(self):
@@ -114,16 +187,21 @@ class Request(object):
         :seealso: https://www.w3.org/Protocols/rfc1341/4_Content-Type.html
         """
         content_type = self.headers.get("content-type", "")
-        type_, *parameters = content_type.split(";")
+        type_, sep, tail = content_type.partition(";")
+
+        # Most requests have no media type parameters.
+        if not sep:
+            return (type_.strip(), dict())
 
-        for i, parameter in enumerate(parameters):
-            parameter = parameter.split("=", 1)
-            if len(parameter) != 2:
+        parameters = dict()
+        for parameter in tail.split(";"):
+            key, sep, value = parameter.partition("=")
+            if not sep:
                 detail="Invalid 'Content-Type' parameter '{}'."\
                     .format(parameter)
                 raise errors.BadRequest(detail=detail)
-            parameters[i] = parameter
-        return (type_, dict(parameters))
+            parameters[key.strip()] = value.strip()
+        return (type_.strip(), parameters)
 
     @cached_property
     def japi_page_number(self):
@@ -344,31 +422,27 @@ class Request(object):
             If the value of a filter is not a JSON object.
         """
         filters = list()
+        for key, value in self.query.items():
+            # Most query keys (*include*, *sort*, *page[size]*, ...) are no
+            # filters. We skip them, before we touch the regular expressions.
+            if not key.startswith("filter["):
+                continue
 
-        KEY_RE = re.compile(r"filter\[([A-z0-9_]+)\]")
-
-        # The first group captures the filters, the second captures the value.
-        VALUE_RE = re.compile(
-            r"(eq:|ne:|lt:|lte:|gt:|gte:|in:|nin:|all:|exists:|iexact:"\
-            r"|contains:|icontains:|startswith:|istartswith:|endswith:"\
-            r"|iendswith:)(.*)"
-        )
-
-        for key, values in self.query.items():
-            key_match = re.fullmatch(KEY_RE, key)
-            value_match = re.fullmatch(VALUE_RE, values[0])
+            key_match = _FILTER_KEY_RE.fullmatch(key)
+            if not key_match:
+                continue
 
             # If the key indicates a filter, but the filtername does not exist,
             # throw a BadRequest exception.
-            if key_match and not value_match:
-                filtername = value_match.group(1)
-                filtername = filtername[:-1]
+            value_match = _FILTER_VALUE_RE.fullmatch(value)
+            if not value_match:
+                filtername = value.partition(":")[0]
                 raise errors.BadRequest(
                     detail="The filter '{}' does not exist.".format(filtername),
                     source_parameter=key
                 )
             # The key indicates a filter and the filternames exists.
-            elif key_match and value_match:
+            else:
                 field = key_match.group(1)
 
                 # Remove the tailing ":" from the filter.
@@ -406,14 +480,14 @@ class Request(object):
         :seealso: http://jsonapi.org/format/#fetching-sparse-fieldsets
         """
         fields = dict()
-
-        FIELDS_RE = re.compile(r"fields\[([A-z0-9_]+)\]")
-
         for key, value in self.query.items():
-            match = re.fullmatch(FIELDS_RE, key)
+            if not key.startswith("fields["):
+                continue
+
+            match = _FIELDS_RE.fullmatch(key)
             if match:
                 typename = match.group(1)
-                type_fields = value[0].split(",")
+                type_fields = value.split(",")
                 type_fields = [
                     item.strip() for item in type_fields if item.strip()
                 ]
@@ -431,13 +505,14 @@ class Request(object):
 
             >>> # /api/Post?include=author,comments.author
             >>> req.japi_include
-            ... [["author"], ["comments", "author"]
+            ... [("author",), ("comments", "author")]
 
         :seealso: http://jsonapi.org/format/#fetching-includes
         """
-        include = self.get_query_argument("include", "")
-        include = [path.split(".") for path in include.split(",") if path]
-        return include
+        include = self.get_query_argument("include")
+        if not include:
+            return list()
+        return [tuple(path.split(".")) for path in include.split(",") if path]
 
     @cached_property
     def japi_sort(self):
@@ -477,12 +552,14 @@ class Request(object):
             *   :meth:`jsonapi.base.api.API.load_json`
         """
         try:
-            if not isinstance(self.body, str):
-                text = self.body.decode()
-            else:
-                text = self.body
-
-            json = self.api.load_json(text)
+            # The body is passed to the JSON decoder as it is. Decoding
+            # *bytes* directly saves an intermediate *str* copy of the body.
+            # The json module accepts *bytes* only since Python 3.6, so we
+            # fall back to decoding the body ourselves.
+            try:
+                json = self.api.load_json(self.body)
+            except TypeError:
+                json = self.api.load_json(self.body.decode())
         except (UnicodeDecodeError, ValueError) as err:
             LOG.debug(err, exc_info=False)
             json = None
@@ -46,6 +46,8 @@ class Response(object):
         If not None, this is a file like object or a filename.
     """
 
+    __slots__ = ("status", "headers", "body", "file")
+
     def __init__(self, status=200, headers=None, body=None, file=None):
         self.status = status
         self.headers = headers if headers is not None else dict()
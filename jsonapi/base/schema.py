@@ -38,6 +38,10 @@ class, this schema is **not** implemented as meta class.
     *   :mod:`jsonapi.marker.property` to decorate properties
 """
 
+# std
+import logging
+import weakref
+
 
 __all__ = [
     "Attribute",
@@ -51,6 +55,9 @@ __all__ = [
 ]
 
 
+LOG = logging.getLogger(__name__)
+
+
 # Attributes
 # ~~~~~~~~~~
 
@@ -236,6 +243,45 @@ class InitConstructor(Constructor):
         return self.resource_class(**kargs)
 
 
+# Maps a resource class to the tuple of markers found on it.
+_MARKERS = weakref.WeakKeyDictionary()
+
+
+def _find_markers(resource_class):
+    """
+    Returns a tuple with all constructor, attribute and relationship markers
+    defined on the *resource_class* and its base classes.
+
+    The markers are defined on the class and not on the instances, so we
+    walk through the class hierarchy only once per class and share the
+    result between all schemas of the class.
+
+    :arg resource_class:
+    """
+    markers = _MARKERS.get(resource_class)
+    if markers is None:
+        # We walk through the class dictionaries along the mro instead of
+        # using *dir()* and *getattr()*, which would trigger all other
+        # descriptors on the class. Markers found first (on the most derived
+        # class) take precedence.
+        markers = list()
+        seen = set()
+        for cls in resource_class.__mro__:
+            for name, prop in vars(cls).items():
+                if name in seen:
+                    continue
+                seen.add(name)
+
+                if isinstance(
+                    prop, (Constructor, Attribute, BaseRelationship)
+                    ):
+                    markers.append(prop)
+
+        markers = tuple(markers)
+        _MARKERS[resource_class] = markers
+    return markers
+
+
 class Schema(object):
     """
     Describes the structure of a resource class. The serializer will use a
@@ -311,46 +357,57 @@ class Schema(object):
         add it to the schema.
         """
         # Find all markers.
-        for name, prop in vars(self.resource_class).items():
-
-            # Constructor
-            if isinstance(prop, Constructor):
-                if not self.constructor is None:
-                    LOG.warning(
-                        "Found two constructors on %s.", self.typename
-                    )
-                self.constructor = constructor
-
-            # IDAttribute
-            elif isinstance(prop, IDAttribute):
-                if not self.id_attribute is None:
-                    LOG.warning(
-                        "Found two id attributes on %s.", self.typename
-                    )
+        for prop in _find_markers(self.resource_class):
+            self._add_field(prop)
+
+        # Use the default constructor, if no special classmethod has been
+        # marked.
+        if self.constructor is None:
+            self.constructor = InitConstructor(self.resource_class)
+        return None
+
+    def _add_field(self, prop):
+        """
+        Adds *prop* to the schema, if it is a constructor, attribute or
+        relationship marker.
+        """
+        # Constructor
+        if isinstance(prop, Constructor):
+            if not self.constructor is None:
+                LOG.warning(
+                    "Found two constructors on %s.", self.typename
+                )
+            else:
+                self.constructor = prop
+
+        # IDAttribute
+        elif isinstance(prop, IDAttribute):
+            if not self.id_attribute is None:
+                LOG.warning(
+                    "Found two id attributes on %s.", self.typename
+                )
+            else:
                 self.id_attribute = prop
 
-            # Attribute
-            elif isinstance(prop, Attribute):
-                if prop.name in self.attributes:
-                    LOG.warning(
-                        "Found the attribute %s twice on %s.",
-                        prop.name, self.typename
-                    )
+        # Attribute
+        elif isinstance(prop, Attribute):
+            if prop.name in self.attributes:
+                LOG.warning(
+                    "Found the attribute %s twice on %s.",
+                    prop.name, self.typename
+                )
+            else:
                 self.attributes[prop.name] = prop
                 self.fields.add(prop.name)
 
-            # Relationship
-            elif isinstance(prop, (ToOneRelationship, ToManyRelationship)):
-                if prop.name in self.relationships:
-                    LOG.warning(
-                        "Found the relationship %s twice on %s.",
-                        prop.name, self.typename
-                    )
+        # Relationship
+        elif isinstance(prop, (ToOneRelationship, ToManyRelationship)):
+            if prop.name in self.relationships:
+                LOG.warning(
+                    "Found the relationship %s twice on %s.",
+                    prop.name, self.typename
+                )
+            else:
                 self.relationships[prop.name] = prop
                 self.fields.add(prop.name)
-
-        # Use the default constructor, if no special classmethod has been
-        # marked.
-        if self.constructor is None:
-            self.constructor = InitConstructor(self.resource_class)
         return None
@@ -33,6 +33,10 @@ A JSONapi serializer and unserializer based on the
 # std
 from collections import OrderedDict
 import logging
+from operator import itemgetter
+
+# third party
+from cached_property import cached_property
 
 # local
 from . import errors
@@ -45,7 +49,10 @@ __all__ = [
 ]
 
 
-LOG = logging.getLogger(__file__)
+LOG = logging.getLogger(__name__)
+
+# Returns the ``(type, id)`` tuple of a resource identifier object.
+_TYPE_ID = itemgetter("type", "id")
 
 
 class Unserializer(object):
@@ -76,47 +83,47 @@ class Unserializer(object):
 
         :seealso: http://jsonapi.org/format/#document-resource-object-relationships
         """
-        # Collect the identifiers.
+        # Collect the identifiers. We remember them for each relationship,
+        # so that the relationships object is parsed only once.
         identifiers = set()
+        to_one = dict()
+        to_many = dict()
+        result = dict()
         for relname, relobj in relationships_object.items():
-            reldata = relobj.get("data")
+            if "data" not in relobj:
+                continue
+            reldata = relobj["data"]
+
+            # *to-one* relationship with no target
+            if reldata is None:
+                result[relname] = None
 
             # *to-one* relationship (with target)
             # -> a single resource identifier object
-            if isinstance(reldata, dict):
-                identifiers.add((reldata["type"], reldata["id"]))
+            elif isinstance(reldata, dict):
+                identifier = _TYPE_ID(reldata)
+                identifiers.add(identifier)
+                to_one[relname] = identifier
 
             # *to-many* relationship
             # -> a list of resource identifier objects
             elif isinstance(reldata, list):
-                identifiers.update(
-                    (item["type"], item["id"]) for item in reldata
-                )
+                relids = list(map(_TYPE_ID, reldata))
+                identifiers.update(relids)
+                to_many[relname] = relids
 
-        # Load the resources
-        relatives = db.get_many(identifiers, required=True)
+        # Load the resources. If the relationships are all empty, we can
+        # spare us the database query.
+        if identifiers:
+            relatives = db.get_many(identifiers, required=True)
+        else:
+            relatives = dict()
 
         # Map the relationship names back to the related resources.
-        result = dict()
-        for relname, relobj in relationships_object.items():
-            if "data" in relobj:
-                reldata = relobj["data"]
-
-                # *to-one* relationship with no target
-                if reldata is None:
-                    result[relname] = None
-                # *to-one* relationship with target
-                elif isinstance(reldata, dict):
-                    identifier = (reldata["type"], reldata["id"])
-                    result[relname] = relatives[identifier]
-                # *to-many* relationship
-                elif isinstance(reldata, list):
-                    identifiers = [
-                        (item["type"], item["id"]) for item in reldata
-                    ]
-                    result[relname] = [
-                        relatives[identifier] for identifier in identifiers
-                    ]
+        for relname, identifier in to_one.items():
+            result[relname] = relatives[identifier]
+        for relname, relids in to_many.items():
+            result[relname] = list(map(relatives.__getitem__, relids))
         return result
 
     def create_resource(self, db, resource_object):
@@ -338,6 +345,32 @@ class Serializer(object):
         self.schema = schema
         return None
 
+    @cached_property
+    def _id_getter(self):
+        """
+        The bound *get()* method of the schema's id attribute.
+        """
+        return self.schema.id_attribute.get
+
+    @cached_property
+    def _attribute_getters(self):
+        """
+        A tuple with the ``(name, getter)`` pairs of the schema attributes,
+        sorted by the name. We sort the fields and bind the getters only once
+        and not for every resource.
+        """
+        attributes = sorted(self.schema.attributes.items(), key=itemgetter(0))
+        return tuple((name, attr.get) for name, attr in attributes)
+
+    @cached_property
+    def _relationships(self):
+        """
+        A tuple with the ``(name, relationship)`` pairs of the schema, sorted
+        by the name.
+        """
+        relationships = self.schema.relationships.items()
+        return tuple(sorted(relationships, key=itemgetter(0)))
+
     def serialize_resource(self, resource, fields=None):
         """
         Creates the JSONapi resource object.
@@ -348,29 +381,42 @@ class Serializer(object):
 
         :seealso: http://jsonapi.org/format/#document-resource-objects
         """
-        d = OrderedDict()
-        d.update(self.serialize_identifier(resource))
-
-        attributes = self.serialize_attributes(resource, fields)
-        if attributes:
-            d["attributes"] = attributes
-
-        relationships = self.serialize_relationships(resource, fields)
-        if relationships:
-            d["relationships"] = relationships
+        # We test the membership of every field name, so a set is faster than
+        # the list from the query string.
+        if fields is not None and not isinstance(fields, (set, frozenset)):
+            fields = frozenset(fields)
+
+        # The identifier object is a new dictionary, so we can simply extend
+        # it instead of copying it.
+        d = self.serialize_identifier(resource)
+
+        # If the schema has no attributes or relationships, we do not need to
+        # create an empty object only to throw it away.
+        if self._attribute_getters:
+            attributes = self.serialize_attributes(resource, fields)
+            if attributes:
+                d["attributes"] = attributes
+
+        if self._relationships:
+            relationships = self.serialize_relationships(resource, fields)
+            if relationships:
+                d["relationships"] = relationships
         return d
 
     def serialize_identifier(self, resource):
         """
         Creates the JSONapi resource identifier object.
 
+        This method must always return a new dictionary, because
+        :meth:`serialize_resource` extends it to the resource object.
+
         :arg resource:
 
         :seealso: http://jsonapi.org/format/#document-resource-identifier-objects
         """
         d = OrderedDict()
         d["type"] = self.schema.typename
-        d["id"] = self.schema.id_attribute.get(resource)
+        d["id"] = self._id_getter(resource)
         return d
 
     def serialize_attributes(self, resource, fields=None):
@@ -384,10 +430,13 @@ class Serializer(object):
         :seealso: http://jsonapi.org/format/#document-resource-object-attributes
         """
         d = OrderedDict()
-        for name in sorted(self.schema.attributes):
-            if fields is None or name in fields:
-                attr = self.schema.attributes[name]
-                d[name] = attr.get(resource)
+        if fields is None:
+            for name, getter in self._attribute_getters:
+                d[name] = getter(resource)
+        else:
+            for name, getter in self._attribute_getters:
+                if name in fields:
+                    d[name] = getter(resource)
         return d
 
     def serialize_relationships(self, resource, fields):
@@ -401,9 +450,13 @@ class Serializer(object):
         :seealso: http://jsonapi.org/format/#document-resource-object-relationships
         """
         d = OrderedDict()
-        for name in sorted(self.schema.relationships):
-            if fields is None or name in fields:
-                d[name] = self.serialize_relationship(resource, name)
+        if fields is None:
+            for name, rel in self._relationships:
+                d[name] = self._serialize_relationship(resource, rel)
+        else:
+            for name, rel in self._relationships:
+                if name in fields:
+                    d[name] = self._serialize_relationship(resource, rel)
         return d
 
     def serialize_relationship(self, resource, name):
@@ -417,6 +470,16 @@ class Serializer(object):
         :seealso: http://jsonapi.org/format/#document-resource-object-relationships
         """
         rel = self.schema.relationships[name]
+        return self._serialize_relationship(resource, rel)
+
+    def _serialize_relationship(self, resource, rel):
+        """
+        Does the same as :meth:`serialize_relationship`, but takes the
+        relationship instead of its name.
+
+        :arg resource:
+        :arg jsonapi.base.schema.BaseRelationship rel:
+        """
         d = OrderedDict()
 
         # Serialize a to-one relationship.
@@ -430,10 +493,7 @@ class Serializer(object):
         # Serialize a to many relationship.
         else:
             relatives = rel.get(resource)
-            relatives = [
-                ensure_identifier_object(item) for item in relatives
-            ]
-            d["data"] = relatives
+            d["data"] = list(map(ensure_identifier_object, relatives))
         return d
 
 
@@ -450,11 +510,24 @@ def serialize_many(resources, fields):
     :seealso: :meth:`Serializer.serialize_resource`
     :seealso: :meth:`jsonapi.base.request.Request.japi_fields`
     """
+    # The resources (especially the included ones) usually share only a few
+    # types, so we look up the serializer and the fieldset only once per
+    # resource class.
+    types = dict()
+
     data = list()
     for resource in resources:
-        serializer = resource._jsonapi["serializer"]
-        typename = resource._jsonapi["typename"]
-        data.append(
-            serializer.serialize_resource(resource, fields=fields.get(typename))
-        )
+        resource_class = type(resource)
+        serialize_args = types.get(resource_class)
+        if serialize_args is None:
+            serializer = resource._jsonapi["serializer"]
+            typename = resource._jsonapi["typename"]
+            typefields = fields.get(typename)
+            if typefields is not None:
+                typefields = frozenset(typefields)
+            serialize_args = (serializer.serialize_resource, typefields)
+            types[resource_class] = serialize_args
+
+        serialize, typefields = serialize_args
+        data.append(serialize(resource, fields=typefields))
     return data
@@ -42,6 +42,7 @@ __all__ = [
     "ensure_identifier",
     "collect_identifiers",
     "relative_identifiers",
+    "relationship_identifiers",
 ]
 
 
@@ -132,29 +133,54 @@ def collect_identifiers(d, include_meta=False):
         >>> collect_identifiers(d)
         {("User", "42"), ("Comment", "2"), ("Comment", "3")}
 
-    :arg dict d:
+    *d* may also be a list of documents. If you need the identifiers of many
+    documents, pass them all at once instead of calling this function for
+    each document and merging the results:
+
+    .. code-block:: python3
+
+        >>> collect_identifiers([d1, d2, d3])
+
+    :arg d:
+        A dictionary or a list of dictionaries
     :arg bool include_meta:
         If true, we also look for (id, type) keys in the meta objects.
     """
     ids = set()
     docs = [d]
+
+    # Bind the frequently used methods to local names. This function walks
+    # through every node of the document.
+    add_id = ids.add
+    push_doc = docs.append
+    pop_doc = docs.pop
+    containers = (dict, list)
+
     while docs:
-        d = docs.pop()
+        d = pop_doc()
 
         if isinstance(d, list):
             for value in d:
-                if isinstance(value, (dict, list)):
-                    docs.append(value)
+                if isinstance(value, containers):
+                    push_doc(value)
 
         elif isinstance(d, dict):
             if "id" in d and "type" in d:
-                ids.add((d["type"], d["id"]))
+                add_id((d["type"], d["id"]))
 
-            for key, value in d.items():
-                if key == "meta" and not include_meta:
+                # Most of the dictionaries are plain resource identifier
+                # objects, which contain no nested documents.
+                if len(d) == 2:
                     continue
-                if isinstance(value, (dict, list)):
-                    docs.append(value)
+
+            if include_meta:
+                for value in d.values():
+                    if isinstance(value, containers):
+                        push_doc(value)
+            else:
+                for key, value in d.items():
+                    if key != "meta" and isinstance(value, containers):
+                        push_doc(value)
     return ids
 
 
@@ -172,7 +198,19 @@ def relative_identifiers(relname, resource):
     relationship = schema.relationships.get(relname)
     if relationship is None:
         raise errors.RelationshipNotFound(schema.typename, relname)
-    elif relationship.to_one:
+    return relationship_identifiers(relationship, resource)
+
+
+def relationship_identifiers(relationship, resource):
+    """
+    Does the same as :func:`relative_identifiers`, but takes the
+    relationship marker instead of its name. This is useful, if the
+    relationship has already been looked up in the schema.
+
+    :arg jsonapi.marker.property.BaseRelationship relationship:
+    :arg resource:
+    """
+    if relationship.to_one:
         relative = relationship.get(resource)
         relatives = [relative] if relative else []
     else:
@@ -57,6 +57,23 @@ __all__ = [
 ]
 
 
+# The members allowed in the different objects. We build the sets only once,
+# a set literal would be created again on each call.
+_RESOURCE_OBJECT_KEYS = frozenset((
+    "id", "type", "attributes", "relationships", "links", "meta"
+))
+_RELATIONSHIP_OBJECT_KEYS = frozenset(("links", "data", "meta"))
+_RESOURCE_IDENTIFIER_OBJECT_KEYS = frozenset(("id", "type", "meta"))
+_LINK_OBJECT_KEYS = frozenset(("href", "meta"))
+
+# Returned by *dict.get()*, if an optional member is not present. We can not
+# use None, because *null* may be an (invalid) value of the member.
+_MISSING = object()
+
+# Used as fallback, if a resource identifier object has no *meta* member.
+_EMPTY_META = dict()
+
+
 def assert_resource_object(d, source_pointer="/"):
     """
     Asserts, that *d* is a JSONapi resource object.
@@ -74,7 +91,7 @@ def assert_resource_object(d, source_pointer="/"):
             source_pointer=source_pointer
         )
 
-    if not d.keys() <= {"id", "type", "attributes", "relationships", "links", "meta"}:
+    if not d.keys() <= _RESOURCE_OBJECT_KEYS:
         raise InvalidDocument(
             detail=(
                 "A resource object may only contain these members: "\
@@ -100,22 +117,23 @@ def assert_resource_object(d, source_pointer="/"):
             source_pointer=source_pointer + "id/"
         )
 
-    if "attributes" in d:
-        assert_attributes_object(
-            d["attributes"], source_pointer + "attributes/"
-        )
-    if "relationships" in d:
+    attributes = d.get("attributes", _MISSING)
+    if attributes is not _MISSING:
+        assert_attributes_object(attributes, source_pointer + "attributes/")
+
+    relationships = d.get("relationships", _MISSING)
+    if relationships is not _MISSING:
         assert_relationships_object(
-            d["relationships"], source_pointer + "relationships/"
-        )
-    if "links" in d:
-        assert_links_object(
-            d["links"], source_pointer + "links/"
-        )
-    if "meta" in d:
-        assert_meta_object(
-            d["meta"], source_pointer + "meta/"
+            relationships, source_pointer + "relationships/"
         )
+
+    links = d.get("links", _MISSING)
+    if links is not _MISSING:
+        assert_links_object(links, source_pointer + "links/")
+
+    meta = d.get("meta", _MISSING)
+    if meta is not _MISSING:
+        assert_meta_object(meta, source_pointer + "meta/")
     return None
 
 
@@ -184,7 +202,7 @@ def assert_relationship_object(d, source_pointer="/"):
             ),
             source_pointer=source_pointer
         )
-    if not d.keys() <= {"links", "data", "meta"}:
+    if not d.keys() <= _RELATIONSHIP_OBJECT_KEYS:
         raise InvalidDocument(
             detail=(
                 "A relationship object may only contain the following members: "
@@ -193,12 +211,17 @@ def assert_relationship_object(d, source_pointer="/"):
             source_pointer=source_pointer
         )
 
-    if "links" in d:
-        assert_links_object(d["links"], source_pointer + "links/")
-    if "meta" in d:
-        assert_meta_object(d["meta"], source_pointer + "meta/")
-    if "data" in d:
-        assert_resource_linkage(d["data"], source_pointer + "data/")
+    links = d.get("links", _MISSING)
+    if links is not _MISSING:
+        assert_links_object(links, source_pointer + "links/")
+
+    meta = d.get("meta", _MISSING)
+    if meta is not _MISSING:
+        assert_meta_object(meta, source_pointer + "meta/")
+
+    data = d.get("data", _MISSING)
+    if data is not _MISSING:
+        assert_resource_linkage(data, source_pointer + "data/")
     return None
 
 
@@ -219,10 +242,14 @@ def assert_resource_linkage(d, source_pointer="/"):
     elif isinstance(d, dict):
         assert_resource_identifier_object(d, source_pointer)
     elif isinstance(d, list):
-        for i, item in enumerate(d):
-            assert_resource_identifier_object(
-                item, source_pointer + str(i) + "/"
-            )
+        # Most documents are valid. So we check all identifiers first without
+        # building a source pointer for each item and look for the detailed
+        # error only, if one of them is invalid.
+        if not all(map(_is_resource_identifier_object, d)):
+            for i, item in enumerate(d):
+                assert_resource_identifier_object(
+                    item, source_pointer + str(i) + "/"
+                )
     else:
         raise InvalidDocument(
             detail=(
@@ -250,7 +277,7 @@ def assert_resource_identifier_object(d, source_pointer="/"):
             detail="A resource identifier object must be an object.",
             source_pointer=source_pointer
         )
-    if not d.keys() <= {"id", "type", "meta"}:
+    if not d.keys() <= _RESOURCE_IDENTIFIER_OBJECT_KEYS:
         raise InvalidDocument(
             detail=(
                 "A resource identifier object can only contain these members: "
@@ -259,8 +286,9 @@ def assert_resource_identifier_object(d, source_pointer="/"):
             source_pointer=source_pointer
         )
 
-    if "meta" in d:
-        assert_meta_object(d["meta"], source_pointer + "meta/")
+    meta = d.get("meta", _MISSING)
+    if meta is not _MISSING:
+        assert_meta_object(meta, source_pointer + "meta/")
 
     if not "type" in d:
         raise InvalidDocument(
@@ -286,6 +314,21 @@ def assert_resource_identifier_object(d, source_pointer="/"):
     return None
 
 
+def _is_resource_identifier_object(d):
+    """
+    Returns True, if *d* is a valid resource identifier object. This is a
+    fast version of :func:`assert_resource_identifier_object`, which does
+    not tell what is wrong.
+
+    :arg d:
+    """
+    return isinstance(d, dict) \
+        and d.keys() <= _RESOURCE_IDENTIFIER_OBJECT_KEYS \
+        and isinstance(d.get("type"), str) \
+        and isinstance(d.get("id"), str) \
+        and isinstance(d.get("meta", _EMPTY_META), dict)
+
+
 def assert_links_object(d, source_pointer="/"):
     """
     Asserts, that *d* is a JSONapi links object.
@@ -322,7 +365,7 @@ def assert_link_object(d, source_pointer="/"):
     if isinstance(d, str):
         pass
     elif isinstance(d, dict):
-        if not d.keys() <= {"href", "meta"}:
+        if not d.keys() <= _LINK_OBJECT_KEYS:
             raise InvalidDocument(
                 detail=(
                     "A link object can only contain these members: "
@@ -27,9 +27,6 @@ jsonapi.bulk_database.database
 ==============================
 """
 
-# std
-from itertools import groupby
-
 # local
 import jsonapi
 
@@ -160,37 +157,47 @@ class Session(jsonapi.base.database.Session):
             typename, order=order, limit=limit, offset=offset, filters=filters
         )
 
-    def get(self, identifier):
+    def get(self, identifier, required=False):
         """
         """
         typename, resource_id = identifier
         session = self.session(typename)
-        return session.get(identifier)
+        return session.get(identifier, required)
 
-    def get_many(self, identifiers):
+    def get_many(self, identifiers, required=False):
         """
         :seealso: :meth:`Session.get_many`
         """
-        result = dict()
+        # Group the identifiers by the typenames in a single pass, so that
+        # each session is queried only once. (*groupby()* would require
+        # sorted identifiers.)
+        groups = dict()
+        for identifier in identifiers:
+            groups.setdefault(identifier[0], list()).append(identifier)
 
-        # Group the resources by the typenames
-        group_key = lambda identifier: identifier[0]
-        for typename, identifiers in groupby(identifiers, group_key):
-            # We need to *list()* the identifiers, because groupby() allows
-            # us to only iterate once over them.
-            identifiers = list(identifiers)
+        result = dict()
+        for typename, identifiers in groups.items():
             session = self.session(typename)
-            resources = session.get_many(identifiers)
+            resources = session.get_many(identifiers, required)
             result.update(resources)
         return result
 
+    def _group_by_typename(self, resources):
+        """
+        Returns a dictionary, which maps the typenames to the resources of
+        this type in *resources*.
+        """
+        get_typename = self.api.get_typename
+
+        groups = dict()
+        for resource in resources:
+            groups.setdefault(get_typename(resource), list()).append(resource)
+        return groups
+
     def save(self, resources):
         """
         """
-        for typename, resources in groupby(resources, self.api.get_typename):
-            # We need to *list()* the resources, because groupby() allows
-            # us to only iterate once over them.
-            resources = list(resources)
+        for typename, resources in self._group_by_typename(resources).items():
             session = self.session(typename)
             session.save(resources)
         return None
@@ -198,10 +205,7 @@ class Session(jsonapi.base.database.Session):
     def delete(self, resources):
         """
         """
-        for typename, resources in groupby(resources, self.api.get_typename):
-            # We need to *list()* the resources, because groupby() allows
-            # us to only iterate once over them.
-            resources = list(resources)
+        for typename, resources in self._group_by_typename(resources).items():
             session = self.session(typename)
             session.delete(resources)
         return None
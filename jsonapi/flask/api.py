@@ -44,7 +44,7 @@ __all__ = [
 ]
 
 
-LOG = logging.getLogger(__file__)
+LOG = logging.getLogger(__name__)
 
 
 def get_request():
@@ -122,10 +122,15 @@ class BaseMarker(object):
 
     def __get__(self, resource, type_=None):
         """
+        Returns the *fget* function bound to the *resource*, so that the
+        decorated method can still be called like a normal method.
+
+        The schema itself never uses this descriptor: it calls :meth:`get`
+        directly on the marker.
         """
-        if not resource:
+        if resource is None:
             return self
-        return functools.partial(self.get, resource)
+        return self.fget.__get__(resource, type_)
 
     def getter(self, f):
         """
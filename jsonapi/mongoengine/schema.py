@@ -39,7 +39,7 @@ import mongoengine
 import jsonapi
 
 
-LOG = logging.getLogger(__file__)
+LOG = logging.getLogger(__name__)
 
 
 __all__ = [
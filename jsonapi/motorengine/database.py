@@ -73,8 +73,12 @@ class Session(jsonapi.asyncio.database.Session):
 
         # We cached the saved resources and deleted resources. The changes
         # will be sent to the database, when *commit()* is called.
+        #
+        # New resources have no id yet. We key them by their Python id()
+        # instead of putting them into a set, which would use the (possibly
+        # overridden) *__hash__()* and *__eq__()* methods of the documents.
         self._saved_resources = dict()
-        self._added_resources = set()
+        self._added_resources = dict()
         self._deleted_resources = dict()
         return None
 
@@ -228,7 +232,7 @@ class Session(jsonapi.asyncio.database.Session):
                 self._saved_resources[identifier] = resource
                 self._deleted_resources.pop(identifier, None)
             else:
-                self._added_resources.add(resource)
+                self._added_resources[id(resource)] = resource
         return None
 
     def delete(self, resources):
@@ -242,7 +246,7 @@ class Session(jsonapi.asyncio.database.Session):
                 self._deleted_resources[identifier] = resource
                 self._saved_resources.pop(identifier, None)
             else:
-                self._added_resources.discard(resource)
+                self._added_resources.pop(id(resource), None)
         return None
 
     @asyncio.coroutine
@@ -250,7 +254,7 @@ class Session(jsonapi.asyncio.database.Session):
         """
         .. todo:: Use bulk insert and bulk delete.
         """
-        for resource in self._added_resources:
+        for resource in self._added_resources.values():
             yield from to_asyncio_future(resource.save())
             
         for resource in self._saved_resources.values():
@@ -40,7 +40,7 @@ import motorengine
 import jsonapi
 
 
-LOG = logging.getLogger(__file__)
+LOG = logging.getLogger(__name__)
 
 
 __all__ = [
@@ -48,7 +48,7 @@ __all__ = [
 ]
 
 
-LOG = logging.getLogger(__file__)
+LOG = logging.getLogger(__name__)
 
 
 class Attribute(jsonapi.base.schema.Attribute):